@@ -1,6 +1,10 @@
+import functools
+from dataclasses import dataclass
+
 import numpy as np
 import pandas as pd
 import scipy.signal
+from scipy import fft as sfft
 from scipy import signal
 from scipy.interpolate import interp1d
 from scipy.optimize import curve_fit, leastsq
@@ -152,9 +156,10 @@ def _fftcorrelate(baseline, estimation, scaling='coeff'):
     ts_outm = np.concatenate([ts_outm, addon], axis=1)
 
     # Compute correlation via fft and re-center to match lags
-    ffta = scipy.fft.fft(ts_inm, axis=1)
-    fftb = scipy.fft.fft(ts_outm, axis=1)
-    corrxy = np.real(np.fft.ifft(ffta * np.conj(fftb), axis=1)) * corr_scale
+    ffta = sfft.fft(ts_inm, axis=1, workers=-1)
+    fftb = sfft.fft(ts_outm, axis=1, workers=-1)
+    corrxy = np.real(sfft.ifft(ffta * np.conj(fftb), axis=1, workers=-1))
+    corrxy *= corr_scale
 
     corrxy = np.roll(corrxy, nl // 2, axis=1)
 
@@ -162,14 +167,18 @@ def _fftcorrelate(baseline, estimation, scaling='coeff'):
 
 
 def averaged_psd(input_tsig, navgs, overlap=0.5,
-                 window='hamming', detrend='linear', scaling='density'):
+                 window='hamming', detrend='linear', scaling='density',
+                 dtype=None, fs=None):
     """
     Calculate an averaged power spectral density for a signal.
 
     Parameters
     ----------
-    input_tsig : numeric
-        Pandas type with the TF input time signal. Index must be time.
+    input_tsig : pandas.Series or DataFrame
+        Pandas type with the TF input time signal. Index must be time. The
+        columns of a DataFrame (e.g. many sensors in a network) are
+        processed together in a single batched welch call, which is much
+        faster than one call per column.
 
     navgs : int
         The number of averages to use based on zero overlap. Overlap will
@@ -189,21 +198,34 @@ def averaged_psd(input_tsig, navgs, overlap=0.5,
         The type of scaling to request from scipy. See scipy.signal.welch for
         more info
 
+    dtype : np.dtype (default None)
+        The dtype to compute in, e.g. np.float32 to halve the memory
+        bandwidth of the FFTs for data that doesn't need full precision.
+        None preserves the dtype of the input.
+
+    fs : numeric (default None)
+        The sampling frequency in Hz. When None it is computed from the
+        time index; callers with a known sample rate can pass it to skip
+        that overhead in tight loops.
+
     Returns
     -------
     output : Series
         Pandas Series containing the power spectral density with an index of
         the frequency.
     """
-    dt = (input_tsig.index[1] - input_tsig.index[0]).total_seconds()
-    fs = 1/dt
+    if fs is None:
+        dt = (input_tsig.index[1] - input_tsig.index[0]).total_seconds()
+        fs = 1/dt
 
     if isinstance(input_tsig, pd.Series):
         return averaged_psd(pd.DataFrame(input_tsig), navgs, overlap, window,
-                            detrend)
+                            detrend, scaling, dtype, fs)
 
     cols = input_tsig.columns
-    input_tsig = input_tsig.values.T
+    # Force a C-contiguous array; sliced DataFrames can hand over F-ordered
+    # or otherwise strided data that scipy's FFT would silently copy anyway
+    input_tsig = np.ascontiguousarray(input_tsig.values.T, dtype=dtype)
 
     nperseg = int(input_tsig.shape[1] // navgs)
     noverlap = int(nperseg * overlap)
@@ -215,19 +237,109 @@ def averaged_psd(input_tsig, navgs, overlap=0.5,
     return pd.DataFrame(psdxx.T, index=f, columns=cols)
 
 
+def _welch_spectra(x, y, fs, window, nperseg, noverlap, detrend):
+    """
+    Compute the averaged auto- and cross-spectra of two signal sets from a
+    single segmentation pass.
+
+    Segmenting, windowing and FFTing the signals once and reusing the
+    segment FFTs for Pxx, Pyy and Pxy does the same math as separate calls
+    to scipy.signal.welch and scipy.signal.csd, but with a third of the
+    FFT work and data movement. Results match scipy's one-sided 'density'
+    scaling with mean averaging.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        2D array of input signals with shape (n_signals, n_samples)
+    y : np.ndarray
+        2D array of output signals with shape (n_signals, n_samples).
+        Singleton first dimensions broadcast against x.
+    fs : numeric
+        The sampling frequency in Hz
+    window : string
+        The window type, see scipy.signal.get_window
+    nperseg : int
+        The number of samples per segment
+    noverlap : int
+        The number of overlapping samples between segments
+    detrend : string, callable, None or False
+        Detrend type ('linear' or 'constant'), a callable applied to the
+        segmented data, or None/False to skip detrending, matching the
+        options scipy.signal.welch accepts
+
+    Returns
+    -------
+    freqs : np.ndarray
+        The one-sided frequency axis
+    psdxx : np.ndarray
+        The PSD of x, shape (n_signals, len(freqs))
+    psdyy : np.ndarray
+        The PSD of y, shape (n_signals, len(freqs))
+    csdxy : np.ndarray
+        The cross spectral density conj(X)*Y, broadcast across the signal
+        dimensions of x and y
+    """
+    # Keep the window in the working precision so single precision inputs
+    # aren't upcast by the windowing multiply
+    win = signal.get_window(window, nperseg)
+    win = win.astype(np.result_type(x.dtype, y.dtype, np.float32), copy=False)
+    step = nperseg - noverlap
+
+    # Strided view of the overlapping segments: (n_signals, n_segs, nperseg)
+    x_segs = np.lib.stride_tricks.sliding_window_view(
+        x, nperseg, axis=-1)[..., ::step, :]
+    y_segs = np.lib.stride_tricks.sliding_window_view(
+        y, nperseg, axis=-1)[..., ::step, :]
+
+    # Match scipy's detrend handling: strings name a detrend type, callables
+    # are applied to the segmented data, and None/False skip detrending
+    if callable(detrend):
+        x_segs = detrend(x_segs)
+        y_segs = detrend(y_segs)
+    elif detrend:
+        x_segs = signal.detrend(x_segs, type=detrend, axis=-1)
+        y_segs = signal.detrend(y_segs, type=detrend, axis=-1)
+
+    # One FFT pass per signal; both spectra and the cross spectrum reuse it
+    x_fft = sfft.rfft(x_segs * win, axis=-1, workers=-1)
+    y_fft = sfft.rfft(y_segs * win, axis=-1, workers=-1)
+
+    # One-sided density scaling to match scipy.signal.welch
+    scale = 1.0 / (fs * np.sum(win * win))
+    psdxx = np.real(np.conj(x_fft) * x_fft) * scale
+    psdyy = np.real(np.conj(y_fft) * y_fft) * scale
+    csdxy = np.conj(x_fft) * y_fft * scale
+
+    # Double everything except the DC bin, and the Nyquist bin when present
+    last = None if nperseg % 2 else -1
+    for spec in (psdxx, psdyy, csdxy):
+        spec[..., 1:last] *= 2
+
+    freqs = sfft.rfftfreq(nperseg, 1 / fs)
+    return (freqs, psdxx.mean(axis=-2), psdyy.mean(axis=-2),
+            csdxy.mean(axis=-2))
+
+
 def averaged_tf(input_tsig, output_tsig,
-                navgs, overlap=0.5, window='hamming', detrend='linear'):
+                navgs, overlap=0.5, window='hamming', detrend='linear',
+                dtype=None, fs=None):
     """
     Calculate a transfer function between two signals, along with their
     coherence.
 
     Parameters
     ----------
-    input_tsig : numeric
+    input_tsig : pandas.Series or DataFrame
         Pandas type with the TF input time signal. Index must be time.
 
-    output_tsig : numeric
+    output_tsig : pandas.Series or DataFrame
         Pandas type with the TF output time signal. Index must be time.
+        All transfer functions are computed in one vectorized spectral
+        pass. When one side is a single column it broadcasts against the
+        columns of the other, so the typical many-sensors-against-one-
+        reference analysis should be made in a single call rather than a
+        loop over sensors.
 
     navgs : int
         The number of averages to use based on zero overlap. Overlap will
@@ -243,6 +355,16 @@ def averaged_tf(input_tsig, output_tsig,
         Detrend type ('linear' or 'constant'). See scipy.signal.psdxx for more
         information.
 
+    dtype : np.dtype (default None)
+        The dtype to compute in, e.g. np.float32 to halve the memory
+        bandwidth of the FFTs for data that doesn't need full precision.
+        None preserves the dtype of the inputs.
+
+    fs : numeric (default None)
+        The sampling frequency in Hz. When None it is computed from the
+        time index; callers with a known sample rate can pass it to skip
+        that overhead in tight loops.
+
     Returns
     -------
     tf : pd.DataFrame
@@ -252,15 +374,16 @@ def averaged_tf(input_tsig, output_tsig,
         the coherence indexed by the frequency and containing the same
         columns as the input
     """
-    dt = (input_tsig.index[1] - input_tsig.index[0]).total_seconds()
-    fs = 1/dt
+    if fs is None:
+        dt = (input_tsig.index[1] - input_tsig.index[0]).total_seconds()
+        fs = 1/dt
 
     if isinstance(output_tsig, pd.Series):
         return averaged_tf(input_tsig, pd.DataFrame(output_tsig),
-                           navgs, overlap, window, detrend)
+                           navgs, overlap, window, detrend, dtype, fs)
     if isinstance(input_tsig, pd.Series):
         return averaged_tf(pd.DataFrame(input_tsig), output_tsig, navgs,
-                           overlap, window, detrend)
+                           overlap, window, detrend, dtype, fs)
 
     if not (isinstance(output_tsig, pd.DataFrame)
             and isinstance(input_tsig, pd.DataFrame)):
@@ -268,8 +391,10 @@ def averaged_tf(input_tsig, output_tsig,
 
     out_cols = output_tsig.columns
     in_cols = input_tsig.columns
-    output_tsig = output_tsig.values.T
-    input_tsig = input_tsig.values.T
+    # Force C-contiguous arrays; sliced DataFrames can hand over F-ordered
+    # or otherwise strided data that scipy's FFT would silently copy anyway
+    output_tsig = np.ascontiguousarray(output_tsig.values.T, dtype=dtype)
+    input_tsig = np.ascontiguousarray(input_tsig.values.T, dtype=dtype)
 
     if len(out_cols) == len(in_cols):
         cols = [f"{in_cols[i]}_{out_cols[i]}" for i in range(len(out_cols))]
@@ -283,33 +408,65 @@ def averaged_tf(input_tsig, output_tsig,
     nperseg = int(input_tsig.shape[1] // navgs)
     noverlap = int(nperseg * overlap)
 
-    # Calculate the transfer function
-    _, psdxx = signal.welch(input_tsig, fs=fs, window=window,
-                            nperseg=nperseg, detrend=detrend,
-                            noverlap=noverlap, scaling='density')
-    _, psdyy = signal.welch(output_tsig, fs=fs, window=window,
-                            nperseg=nperseg, detrend=detrend,
-                            noverlap=noverlap, scaling='density')
-    freqs, csdxy = signal.csd(input_tsig, output_tsig, fs=fs, window=window,
-                              nperseg=nperseg, detrend=detrend,
-                              noverlap=noverlap)
+    # Calculate all spectra from a single segmentation/FFT pass rather than
+    # separate welch/csd/coherence calls that each re-FFT the signals
+    freqs, psdxx, psdyy, csdxy = _welch_spectra(input_tsig, output_tsig,
+                                                fs, window, nperseg,
+                                                noverlap, detrend)
 
     # Calculating manually allows for vectorization and is faster
     with np.errstate(divide='ignore', invalid='ignore'):
         tf = csdxy / psdxx
         coh = np.abs(csdxy) ** 2 / (psdxx * psdyy)
 
-    # Calculate the coherence
-    # _, coh = signal.coherence(input_tsig, output_tsig, fs=fs, window=window,
-    #                           nperseg=nperseg, noverlap=noverlap,
-    #                           detrend=detrend)
-
     tf = pd.DataFrame(tf.T, index=freqs, columns=cols)
     coh = pd.DataFrame(coh.T, index=freqs, columns=cols)
 
     return tf, coh
 
 
+def _abs_angle(z):
+    """
+    Compute the magnitude and phase of a complex array together.
+
+    Computing via hypot/arctan2 on the real and imaginary parts avoids the
+    separate complex-dispatch passes of np.abs and np.angle. When numba is
+    installed this function is replaced by a compiled kernel below that
+    extracts both in a single sweep over the array.
+
+    Parameters
+    ----------
+    z : np.ndarray
+        2D complex array
+
+    Returns
+    -------
+    mag : np.ndarray
+        The elementwise magnitude of z
+    phase : np.ndarray
+        The elementwise phase angle of z in radians
+    """
+    return np.hypot(z.real, z.imag), np.arctan2(z.imag, z.real)
+
+
+try:
+    from numba import njit as _njit
+
+    @_njit(cache=True)
+    def _abs_angle(z):  # noqa: F811
+        mag = np.empty_like(z.real)
+        phase = np.empty_like(z.real)
+        n, m = z.shape
+        for i in range(n):
+            for j in range(m):
+                zij = z[i, j]
+                mag[i, j] = np.hypot(zij.real, zij.imag)
+                phase[i, j] = np.arctan2(zij.imag, zij.real)
+        return mag, phase
+except ImportError:
+    pass
+
+
 def interp_tf(new_freq, input_tf):
     """
     Interpolate a transfer function in the frequency domain by magnitude and
@@ -329,27 +486,57 @@ def interp_tf(new_freq, input_tf):
     interp_tf : pd.Series or pd.DataFrame
         The transfer function interpolated to the new frequency axis. Type will
         match the type of the input.
+
+    Notes
+    -----
+    The sorted magnitude and unwrapped phase of the transfer function are
+    cached in input_tf.attrs, so repeated interpolation of the same object
+    (e.g. by apply_filter over many signals) skips that preprocessing. The
+    cache is validated against both the index and the values, since pandas
+    propagates attrs through copies and arithmetic. See compile_filter()
+    for an explicit way to amortize this preprocessing.
     """
-    sortinds = input_tf.index.argsort()
     if type(input_tf) is type(pd.Series()):
         use_tf = pd.DataFrame(input_tf)
     else:
         use_tf = input_tf
 
-    # Generate a function handle and interpolate the magnitude
-    interp_mag_func = interp1d(use_tf.index[sortinds],
-                               np.abs(use_tf.iloc[sortinds, :]),
-                               axis=0)
-    interp_mag = interp_mag_func(new_freq)
-
-    # Generate a function handle and interpolate the phase
-    # Work on the unwrapped angle to make sure that we don't have weird
-    # results in the middle of wraps.
-    interp_phase_func = interp1d(use_tf.index[sortinds],
-                                 np.unwrap(np.angle(use_tf.iloc[sortinds, :]),
-                                           axis=0),
-                                 axis=0)
-    interp_phase = interp_phase_func(new_freq)
+    # Reuse the sorted magnitude/unwrapped phase if we've seen this exact
+    # filter. pandas carries attrs over to copies and results of arithmetic
+    # (e.g. filt * 2), so the values must be checked as well as the index
+    # before trusting the cache.
+    cache = input_tf.attrs.get('_interp_cache')
+    if (cache is None
+            or not np.array_equal(cache[0], use_tf.index.values)
+            or not np.array_equal(cache[1], use_tf.values)):
+        sortinds = use_tf.index.argsort()
+        freqs = use_tf.index.values[sortinds]
+        tf_vals = np.ascontiguousarray(use_tf.values[sortinds, :])
+        mag, phase = _abs_angle(tf_vals)
+        # Work on the unwrapped angle to make sure that we don't have weird
+        # results in the middle of wraps.
+        phase = np.unwrap(phase, axis=0)
+        cache = (use_tf.index.values.copy(), use_tf.values.copy(),
+                 freqs, mag, phase)
+        input_tf.attrs['_interp_cache'] = cache
+    _, _, freqs, mag, phase = cache
+
+    # Match the out-of-range behavior of scipy.interpolate.interp1d
+    new_freq = np.asarray(new_freq)
+    if np.min(new_freq) < freqs[0] or np.max(new_freq) > freqs[-1]:
+        raise ValueError("A value in new_freq is outside the frequency "
+                         "range of the transfer function.")
+
+    # Interpolate magnitude and phase columnwise. np.interp is much lighter
+    # weight than constructing interp1d objects for simple linear interp.
+    # Buffers take the filter's own precision so that single precision
+    # filters produce complex64 without an upcast.
+    interp_mag = np.empty((len(new_freq), mag.shape[1]), dtype=mag.dtype)
+    interp_phase = np.empty((len(new_freq), phase.shape[1]),
+                            dtype=phase.dtype)
+    for i in range(mag.shape[1]):
+        interp_mag[:, i] = np.interp(new_freq, freqs, mag[:, i])
+        interp_phase[:, i] = np.interp(new_freq, freqs, phase[:, i])
 
     # Recreate the complex TF
     interp_filt = interp_mag * np.exp(1j * interp_phase)
@@ -673,9 +860,9 @@ def compute_delays(ts_in, ts_out, mode='loop', scaling='coeff'):
         zero_lag_ind = np.where(lags == 0)
 
         # Compute correlation via fft and re-center to match lags
-        ffta = scipy.fft.fft(ts_inm, axis=1)
-        fftb = scipy.fft.fft(ts_outm, axis=1)
-        corrxy = np.real(np.fft.ifft(ffta * np.conj(fftb), axis=1))
+        ffta = sfft.fft(ts_inm, axis=1, workers=-1)
+        fftb = sfft.fft(ts_outm, axis=1, workers=-1)
+        corrxy = np.real(sfft.ifft(ffta * np.conj(fftb), axis=1, workers=-1))
 
         # Extract value and lag of peak correlation
         peak_lag_indices = corrxy.argmax(axis=1)
@@ -780,31 +967,79 @@ def get_1d_plant(centers, ref_center=0,
 
     # Creating the individual plant windows ###############
 
+    # x_vec is sorted and uniformly spaced, so the span of indices covered
+    # by each center can be found with searchsorted rather than scanning the
+    # full (potentially very long) x_vec with a boolean mask per center.
     if shape.lower() == "square":
         # Square individual plants
         # Lc = L total plant
         # north = # of sites
         # Lc/north = separation
-        for center in centers:
-            inds = np.bitwise_and(x_vec >= (center - w / 2),
-                                  x_vec < (center + w / 2))
-            plant[inds] = 1
+        los = np.searchsorted(x_vec, centers - w / 2)
+        his = np.searchsorted(x_vec, centers + w / 2)
+        for lo, hi in zip(los, his):
+            plant[lo:hi] = 1
     elif shape.lower() == "triangle":
-        for center in centers:
-            inds = np.bitwise_and(x_vec >= (center - w / 2),
-                                  x_vec < (center + w / 2))
-            plant[inds] = x_vec[inds] - center+w/2
+        los = np.searchsorted(x_vec, centers - w / 2)
+        his = np.searchsorted(x_vec, centers + w / 2)
+        for center, lo, hi in zip(centers, los, his):
+            plant[lo:hi] = x_vec[lo:hi] - center+w/2
     elif shape.lower() == "gaussian":
-        # Gaussian Window
-        for center in centers:
-            plant += np.exp(-(x_vec-center)**2/(2*(w/2.355)**2))  # FWHM is STD
+        # Gaussian Window, accumulated by a windowed kernel that is compiled
+        # with numba when available
+        sigma = w / 2.355  # FWHM is STD
+        _gauss_plant(centers, x_vec, sigma, plant)
     else:
         raise ValueError("No info for plant shape: {}".format(shape))
 
     return plant, x_vec
 
 
-def plant1d_to_camfilter(plant, x_plant, cloud_speed):
+def _gauss_plant(centers, x_vec, sigma, plant):
+    """
+    Accumulate a gaussian window for each center into the plant array.
+
+    Each center only touches the cells within +/- 6 standard deviations,
+    where the truncated tail is below 2e-8 of the peak. When numba is
+    installed this function is replaced by a compiled kernel below that
+    fuses the exponential and the accumulation with no temporary arrays.
+
+    Parameters
+    ----------
+    centers : np.array
+        The center positions of the individual plant components
+    x_vec : np.array
+        The sorted, uniformly spaced position axis for the plant
+    sigma : numeric
+        The standard deviation of the gaussian window
+    plant : np.array
+        The plant density array to accumulate into. Modified in place.
+    """
+    los = np.searchsorted(x_vec, centers - 6 * sigma)
+    his = np.searchsorted(x_vec, centers + 6 * sigma)
+    for center, lo, hi in zip(centers, los, his):
+        plant[lo:hi] += np.exp(-(x_vec[lo:hi]-center)**2/(2*sigma**2))
+
+
+try:
+    from numba import njit
+
+    @njit(cache=True)
+    def _gauss_plant(centers, x_vec, sigma, plant):  # noqa: F811
+        n = plant.shape[0]
+        x0 = x_vec[0]
+        dx = x_vec[1] - x_vec[0]
+        denom = 2 * sigma * sigma
+        for center in centers:
+            i_lo = max(0, int(np.ceil((center - 6 * sigma - x0) / dx)))
+            i_hi = min(n, int(np.ceil((center + 6 * sigma - x0) / dx)))
+            for i in range(i_lo, i_hi):
+                plant[i] += np.exp(-(x_vec[i] - center)**2 / denom)
+except ImportError:
+    pass
+
+
+def plant1d_to_camfilter(plant, x_plant, cloud_speed, dtype=None):
     """
     Take a 1D plant and compute the Cloud Advection Model representation
 
@@ -822,33 +1057,118 @@ def plant1d_to_camfilter(plant, x_plant, cloud_speed):
         The plant's x-coordinate. Should have a value of zero at the location
         of the reference point. See get_1d_plant().
 
+    dtype : np.dtype (default None)
+        The dtype to compute in, e.g. np.float32 to halve the memory
+        bandwidth of the FFT. None preserves the dtype of the plant.
+
     Returns
     -------
     filter : pd.Series
         A pandas series with the complex valued transfer function, indexed by
-        the corresponding frequency.
+        the corresponding frequency. The filter is one-sided: the plant is
+        real, so only the non-negative frequencies are computed and the
+        negative half of the spectrum is implied by conjugate symmetry.
     """
     # TODO needs to be validated
 
+    if cloud_speed == 0:
+        raise ValueError('cloud_speed must be nonzero.')
+
     dx = x_plant[1]-x_plant[0]
 
+    plant = np.ascontiguousarray(plant, dtype=dtype)
     plant = plant / np.sum(plant)  # normalize the plant
-    camfilt = np.fft.fft(plant)  # What does it look like in f domain
+    camfilt = sfft.rfft(plant, workers=-1)  # What's it look like in f domain
     spatialdt = dx / np.abs(cloud_speed)  # Effective dt for cloud motion
-    camfreq = np.fft.fftfreq(plant.shape[-1], spatialdt)
-
-    # Shift the phase
-    t_delay = np.min(x_plant) / cloud_speed
-    if cloud_speed > 0:
-        camfilt = camfilt * np.exp(
-            1j * camfreq * (2 * np.pi) * t_delay)
-    else:
-        camfilt = np.conj(
-            camfilt * np.exp(1j * camfreq * (2 * np.pi) * -t_delay))
+    camfreq = sfft.rfftfreq(plant.shape[-1], spatialdt)
+
+    # Shift the phase, conjugating for negative speeds rather than building
+    # a separate expression per direction. The phase factor is cast to the
+    # working precision so it doesn't upcast a single precision filter.
+    t_delay = np.min(x_plant) / np.abs(cloud_speed)
+    camfilt *= np.exp(
+        1j * camfreq * (2 * np.pi) * t_delay).astype(camfilt.dtype)
+    if cloud_speed < 0:
+        np.conj(camfilt, out=camfilt)
     return pd.Series(camfilt, index=camfreq)
 
 
-def apply_filter(input_tsig, comp_filt):
+@dataclass
+class CompiledFilter:
+    """
+    A complex frequency-domain filter preprocessed for repeated application.
+
+    Holds the sorted frequency axis together with the magnitude and
+    unwrapped phase of the filter, which is everything apply_filter needs
+    to interpolate onto a signal's frequency axis. Build one with
+    compile_filter() when the same filter is applied to many signals, so
+    the sort, magnitude and phase-unwrap work is done once up front.
+
+    Parameters
+    ----------
+    freq : np.ndarray
+        The frequency axis in Hz, sorted ascending
+    mag : np.ndarray
+        The filter magnitude at each frequency
+    unwrapped_phase : np.ndarray
+        The unwrapped filter phase at each frequency, in radians
+    """
+    freq: np.ndarray
+    mag: np.ndarray
+    unwrapped_phase: np.ndarray
+
+
+def compile_filter(comp_filt):
+    """
+    Preprocess a filter for repeated use with apply_filter.
+
+    Parameters
+    ----------
+    comp_filt : pd.Series
+        Complex valued filter with its frequency in the index. See for
+        example: get_camfilter
+
+    Returns
+    -------
+    compiled : CompiledFilter
+        The preprocessed filter. Arrays keep the precision of the input
+        filter (e.g. complex64 filters produce float32 arrays).
+    """
+    sortinds = comp_filt.index.argsort()
+    freq = comp_filt.index.values[sortinds]
+    vals = np.ascontiguousarray(comp_filt.values[sortinds].reshape(-1, 1))
+    mag, phase = _abs_angle(vals)
+    phase = np.unwrap(phase, axis=0)
+    return CompiledFilter(freq, mag[:, 0], phase[:, 0])
+
+
+@functools.lru_cache(maxsize=32)
+def _rfftfreq_cached(n, dt):
+    """
+    Memoized scipy.fft.rfftfreq. Workflows that filter many signals of the
+    same length and sample rate (typical for uniformly sampled sensor
+    networks) would otherwise allocate an identical frequency array on
+    every apply_filter call. The returned array is marked read-only since
+    it is shared between callers.
+
+    Parameters
+    ----------
+    n : int
+        The signal length
+    dt : float
+        The sample spacing in seconds
+
+    Returns
+    -------
+    freqs : np.ndarray
+        Read-only array of the rfft sample frequencies
+    """
+    freqs = sfft.rfftfreq(n, dt)
+    freqs.flags.writeable = False
+    return freqs
+
+
+def apply_filter(input_tsig, comp_filt, dtype=None):
     """
     Apply a filter to a signal, and return the filtered signal. Works to align
     the frequency axis of the computed filter with the input signal.
@@ -858,39 +1178,186 @@ def apply_filter(input_tsig, comp_filt):
     input_tsig : pandas.Series or DataFrame
         Pandas type that contains the time signal
 
-    comp_filt : Series, DataFrame
-        Pandas type containing the complex valued filter to apply with its
-        frequency in the index. See for example: get_camfilter
+    comp_filt : Series or CompiledFilter
+        The complex valued filter to apply, either as a pandas type with
+        its frequency in the index (see for example: get_camfilter), or
+        preprocessed with compile_filter() to amortize the setup cost when
+        applying the same filter to many signals.
+
+    dtype : np.dtype (default None)
+        The dtype to compute in, e.g. np.float32 to halve the memory
+        bandwidth of the FFTs. None preserves the dtype of the input.
 
     Returns
     -------
     filtered_sig : numeric
         The filtered time series.
+
+    Notes
+    -----
+    The signal is zero padded to the next fast FFT length (see
+    scipy.fft.next_fast_len) before transforming and truncated back to its
+    original length afterwards. This avoids the slow FFT code paths for
+    lengths with large prime factors, but slightly changes how the circular
+    convolution wraps around at the very edges of the signal compared to an
+    unpadded transform.
     """
-    # Get the fft of the input signal, including its frequency axis
+    # Get the fft of the input signal, including its frequency axis. The
+    # signal is real, so the one-sided rfft covers it with half the work and
+    # memory of the full fft, and the negative frequencies of the filter
+    # never need to be interpolated.
     dt = (input_tsig.index[1] - input_tsig.index[0]).total_seconds()
-    input_fft = np.fft.fft(input_tsig) * 2 / len(input_tsig)
-    f_vec = np.fft.fftfreq(input_tsig.shape[-1], dt)
-
-    if np.max(f_vec) > np.max(comp_filt.index):
+    n = input_tsig.shape[-1]
+    m = sfft.next_fast_len(n, real=True)
+    input_fft = sfft.rfft(np.ascontiguousarray(input_tsig.to_numpy(),
+                                               dtype=dtype),
+                          n=m, workers=-1)
+    f_vec = _rfftfreq_cached(m, dt)
+
+    # Frequency coverage check. f_vec and the frequencies of filters built
+    # by this module are sorted ascending, so the maxima are just the last
+    # entries and need no full scan. Filters with an unsorted index (e.g. a
+    # legacy two-sided filter in raw fftfreq order) fall back to a real max.
+    is_compiled = isinstance(comp_filt, CompiledFilter)
+    if is_compiled:
+        filt_fmax = comp_filt.freq[-1]
+    elif comp_filt.index.is_monotonic_increasing:
+        filt_fmax = comp_filt.index.values[-1]
+    else:
+        filt_fmax = comp_filt.index.max()
+    if f_vec[-1] > filt_fmax:
         raise ValueError('Error: the TF to apply does not cover the entire '
                          'frequency axis needed for the signal. Please '
                          'provide a TF with a higher maximum frequency.')
 
-    # Interpolate the computational
-    interp_filt = interp_tf(f_vec, comp_filt)
+    # Interpolate the computational filter onto the signal's frequency axis
+    if is_compiled:
+        mag = np.interp(f_vec, comp_filt.freq, comp_filt.mag)
+        phase = np.interp(f_vec, comp_filt.freq, comp_filt.unwrapped_phase)
+        interp_filt = mag * np.exp(1j * phase)
+    else:
+        interp_filt = interp_tf(f_vec, comp_filt).to_numpy()
 
     # Apply the filter and invert.
     filtered_fft = input_fft * interp_filt
-    filtered_sig = np.fft.ifft(filtered_fft * len(input_tsig) / 2)
-    filtered_sig = np.real(filtered_sig)
+    filtered_sig = sfft.irfft(filtered_fft, n=m, workers=-1)[:n]
     filtered_sig = pd.Series(filtered_sig, index=input_tsig.index)
 
     return filtered_sig
 
 
+def _analytic_camfilter(centers, cloud_speed, freqs, width, shape):
+    """
+    Evaluate the Cloud Advection Model transfer function in closed form on
+    an arbitrary frequency grid.
+
+    The plant is a sum of identical windows at each center, so its Fourier
+    transform is the window's transform times a sum of phase shifts, one
+    per center. Evaluating that directly avoids building and FFT'ing the
+    long spatial representation of the plant and needs no interpolation
+    onto the signal's frequency axis afterwards.
+
+    Parameters
+    ----------
+    centers : np.array
+        Positions of the individual plant components along the cloud motion
+        direction, relative to the reference. See spatial.project_vectors().
+    cloud_speed : numeric
+        The cloud motion vector speed
+    freqs : np.array
+        The frequencies at which to evaluate the filter, in Hz
+    width : numeric
+        The size of each individual plant component
+    shape : string
+        The shape of each individual plant component. Closed forms exist
+        for 'square' and 'gaussian'.
+
+    Returns
+    -------
+    camfilter : pd.Series
+        A pandas Series with the complex valued filter, indexed by freqs.
+    """
+    if cloud_speed == 0:
+        raise ValueError('cloud_speed must be nonzero.')
+
+    centers = np.array(centers).flatten()
+    freqs = np.asarray(freqs)
+
+    # Each site sees the cloud with a delay of its position over the speed
+    t_k = centers / cloud_speed
+    phases = np.exp(-2j * np.pi * np.outer(freqs, t_k)).mean(axis=1)
+
+    # The envelope is the Fourier transform of a single plant component
+    if shape.lower() == "square":
+        envelope = np.sinc(freqs * width / np.abs(cloud_speed))
+    elif shape.lower() == "gaussian":
+        sigma = width / 2.355  # FWHM is STD
+        envelope = np.exp(-2 * (np.pi * sigma * freqs / cloud_speed)**2)
+    else:
+        raise ValueError("No closed form for plant shape: {}".format(shape))
+
+    return pd.Series(phases * envelope, index=freqs)
+
+
+def apply_filter_batch(input_tsigs, comp_filt, dtype=None):
+    """
+    Apply a single filter to many signals at once, and return the filtered
+    signals. Equivalent to calling apply_filter on each column, but the
+    filter is compiled once and all columns go through one batched
+    multi-threaded FFT, which scales much better than a per-column loop.
+
+    Parameters
+    ----------
+    input_tsigs : pandas.DataFrame
+        Pandas type that contains the time signals, one per column, sharing
+        a common time index.
+
+    comp_filt : Series or CompiledFilter
+        The complex valued filter to apply to every column. See
+        apply_filter.
+
+    dtype : np.dtype (default None)
+        The dtype to compute in, e.g. np.float32 to halve the memory
+        bandwidth of the FFTs. None preserves the dtype of the input.
+
+    Returns
+    -------
+    filtered_sigs : pandas.DataFrame
+        The filtered time series, with the index and columns of the input.
+
+    Notes
+    -----
+    Signals are zero padded to the next fast FFT length just like in
+    apply_filter; see the note there about the wrap-around at the signal
+    edges.
+    """
+    dt = (input_tsigs.index[1] - input_tsigs.index[0]).total_seconds()
+    n = input_tsigs.shape[0]
+    m = sfft.next_fast_len(n, real=True)
+    x = np.ascontiguousarray(input_tsigs.to_numpy(), dtype=dtype)
+    input_fft = sfft.rfft(x, n=m, axis=0, workers=-1)
+    f_vec = _rfftfreq_cached(m, dt)
+
+    if not isinstance(comp_filt, CompiledFilter):
+        comp_filt = compile_filter(comp_filt)
+
+    if f_vec[-1] > comp_filt.freq[-1]:
+        raise ValueError('Error: the TF to apply does not cover the entire '
+                         'frequency axis needed for the signal. Please '
+                         'provide a TF with a higher maximum frequency.')
+
+    mag = np.interp(f_vec, comp_filt.freq, comp_filt.mag)
+    phase = np.interp(f_vec, comp_filt.freq, comp_filt.unwrapped_phase)
+    interp_filt = mag * np.exp(1j * phase)
+
+    input_fft *= interp_filt[:, np.newaxis]
+    filtered = sfft.irfft(input_fft, n=m, axis=0, workers=-1)[:n]
+    return pd.DataFrame(filtered, index=input_tsigs.index,
+                        columns=input_tsigs.columns)
+
+
 def get_camfilter(positions, cloud_speed, cloud_dir, ref_position, dx=1,
-                  **kwargs):
+                  target_freq=None, **kwargs):
     """
     Compute the filter for the CAM model
 
@@ -918,6 +1385,13 @@ def get_camfilter(positions, cloud_speed, cloud_dir, ref_position, dx=1,
         The spatial spacing that should be used in representing the plant.
         Affects the frequency band that can be represented.
 
+    target_freq : numeric (default None)
+        A frequency axis (in Hz) to evaluate the filter on directly, for
+        example the rfftfreq axis of the signal that will be filtered. When
+        given, the filter is computed in closed form on that grid (for
+        'square' and 'gaussian' shapes), skipping the FFT of the spatial
+        plant and the later interpolation step inside apply_filter.
+
     **kwargs : various
         Parameters that will be passed to get_1D_plant(). Include
             'width' - numeric width of each centered object
@@ -944,6 +1418,12 @@ def get_camfilter(positions, cloud_speed, cloud_dir, ref_position, dx=1,
                                        ref_utm[['E', 'N']])
     pos_dists = spatial.project_vectors(pos_vecs, cloud_dir)
 
+    if target_freq is not None:
+        width = kwargs.get('width')
+        shape = kwargs.get('shape', 'square')
+        return _analytic_camfilter(pos_dists, cloud_speed, target_freq,
+                                   width if width is not None else dx, shape)
+
     plant, x_plant = get_1d_plant(pos_dists, dx=dx, **kwargs)
     camfilter = plant1d_to_camfilter(plant, x_plant, cloud_speed)
     return camfilter
@@ -972,14 +1452,21 @@ def get_marcosfilter(s, freq=None):
         freq = np.linspace(0, 0.5, 100)
     k = 1
     fc = 0.02 / np.sqrt(s)
-    filt = k / (1j * freq / fc + 1)
+    # Build k / (1j * freq / fc + 1) directly in complex64 rather than
+    # computing in complex128 and casting, which wastes an allocation
+    filt = np.empty(np.shape(freq), dtype=np.complex64)
+    filt.real = 1.0
+    filt.imag = np.asarray(freq) / fc
+    np.reciprocal(filt, out=filt)
+    filt *= k
     return pd.Series(filt, index=freq, dtype=np.complex64)
 
 
 def cleanfreq(sig):
     """
     Cleanup the bidirectional frequencies of a filter object for better
-    visualization without lines wrapping across the zero.
+    visualization without lines wrapping across the zero. One-sided filters
+    (e.g. from plant1d_to_camfilter) have no wrap and are left unchanged.
 
     Parameters
     ----------
@@ -990,6 +1477,11 @@ def cleanfreq(sig):
     -------
     The signal object with modified frequency
     """
+    # A two-sided fftfreq axis jumps from its max down to the negative
+    # frequencies partway through; break the line at that wrap point.
+    wraps = np.nonzero(np.diff(sig.index.values) < 0)[0]
+    if len(wraps) == 0:
+        return
     idxlist = sig.index.to_list()
-    idxlist[len(sig.index) // 2] = None
+    idxlist[wraps[0] + 1] = None
     sig.index = idxlist
@@ -4,7 +4,7 @@ import pandas as pd
 import numpy as np
 from scipy import signal
 from scipy.interpolate import interp1d
-from solarspatialtools.signalproc import averaged_psd, averaged_tf, interp_tf, tf_delay, xcorr_delay, apply_delay, correlation, compute_delays, _fftcorrelate
+from solarspatialtools.signalproc import averaged_psd, averaged_tf, interp_tf, tf_delay, xcorr_delay, apply_delay, correlation, compute_delays, _fftcorrelate, apply_filter, apply_filter_batch, compile_filter, get_1d_plant, plant1d_to_camfilter, get_camfilter
 
 
 @pytest.fixture(params=[0, 0.2, -0.2, 0.4, -0.4, 1, -1])
@@ -472,3 +472,172 @@ def test_compute_delays(delay, compute_delays_modes):
     delays, _ = compute_delays(xsigs, ysigs, compute_delays_modes)
 
     assert np.allclose(delays, delay_ins)
+
+
+@pytest.fixture
+def cam_filter_data():
+    np.random.seed(2023)
+    n = 3600
+    t = np.arange(n)
+    x = 500 + np.cumsum(np.random.randn(n))
+    tsig = pd.Series(x, index=pd.TimedeltaIndex(t, 's'))
+
+    centers = np.array([0.0, 50.0, -80.0, 250.0])
+    plant, x_vec = get_1d_plant(centers, width=20, dx=1, xmax=100000)
+    comp_filt = plant1d_to_camfilter(plant, x_vec, 10.0)
+    return tsig, plant, x_vec, comp_filt
+
+
+def test_apply_filter_compiled(cam_filter_data):
+    tsig, plant, x_vec, comp_filt = cam_filter_data
+
+    # A precompiled filter should reproduce the Series filter path exactly
+    direct = apply_filter(tsig, comp_filt)
+    compiled = apply_filter(tsig, compile_filter(comp_filt))
+
+    assert np.allclose(direct, compiled)
+
+
+def test_apply_filter_batch(cam_filter_data):
+    tsig, plant, x_vec, comp_filt = cam_filter_data
+    tsigs_df = pd.DataFrame({i: np.roll(tsig.values, 5 * i)
+                             for i in range(4)}, index=tsig.index)
+
+    batch = apply_filter_batch(tsigs_df, comp_filt)
+
+    # Batch application should match looping apply_filter over the columns
+    loop = [apply_filter(tsigs_df[i], comp_filt) for i in range(4)]
+    assert np.allclose(batch.values, np.array(loop).T)
+    assert batch.index.equals(tsigs_df.index)
+    assert list(batch.columns) == list(tsigs_df.columns)
+
+
+def test_apply_filter_two_sided(cam_filter_data):
+    tsig, plant, x_vec, comp_filt = cam_filter_data
+
+    # Reconstruct the legacy layout: a two-sided filter in raw fftfreq
+    # order, as plant1d_to_camfilter produced before it became one-sided
+    p = plant / np.sum(plant)
+    freqs = np.fft.fftfreq(len(p), 1 / 10.0)
+    t_delay = np.min(x_vec) / 10.0
+    legacy = pd.Series(np.fft.fft(p) * np.exp(1j * freqs * 2 * np.pi
+                                              * t_delay), index=freqs)
+
+    one_sided = apply_filter(tsig, comp_filt)
+    two_sided = apply_filter(tsig, legacy)
+
+    assert np.allclose(one_sided, two_sided, atol=1e-8)
+
+
+def test_apply_filter_float32(cam_filter_data):
+    tsig, plant, x_vec, comp_filt = cam_filter_data
+
+    filt32 = plant1d_to_camfilter(plant, x_vec, 10.0, dtype=np.float32)
+    assert filt32.values.dtype == np.complex64
+
+    result64 = apply_filter(tsig, comp_filt)
+    result32 = apply_filter(tsig, filt32, dtype=np.float32)
+
+    assert result32.values.dtype == np.float32
+    assert np.allclose(result32, result64, atol=1e-2)
+
+
+@pytest.mark.parametrize("cloud_speed", [20.0, -20.0])
+@pytest.mark.parametrize("shape,shape_atol", [('square', 1e-2),
+                                              ('gaussian', 1e-4)])
+def test_get_camfilter_analytic(cloud_speed, shape, shape_atol):
+    np.random.seed(2023)
+    # Sites spaced so the individual plant components don't overlap, since
+    # overlap saturates in the spatial representation but sums in the
+    # closed form
+    northing = np.arange(8) * 100.0 + np.random.uniform(-20, 20, 8)
+    positions = pd.DataFrame({'E': np.zeros(8), 'N': northing})
+    ref_position = positions.iloc[2]
+
+    fft_filt = get_camfilter(positions, cloud_speed, (0, 1), ref_position,
+                             dx=1, width=40, shape=shape)
+
+    target_freq = np.linspace(0, 0.05, 200)
+    analytic = get_camfilter(positions, cloud_speed, (0, 1), ref_position,
+                             dx=1, width=40, shape=shape,
+                             target_freq=target_freq)
+
+    # The closed form should agree with the interpolated FFT-based filter
+    # up to the FFT path's spatial discretization error
+    assert np.allclose(analytic.values, interp_tf(target_freq, fft_filt),
+                       atol=shape_atol)
+    assert np.allclose(analytic.index, target_freq)
+
+
+def test_averaged_psd_float32():
+    np.random.seed(2023)
+    fs = 10
+    T = 5.0
+    t = np.linspace(0, T, int(T*fs), endpoint=False)
+    x = 0.5*np.sin(2*np.pi*2*t) + np.random.random(len(t))
+    input_tsig = pd.Series(x, index=pd.TimedeltaIndex(t, 's'))
+
+    psd64 = averaged_psd(input_tsig, navgs=5)
+    psd32 = averaged_psd(input_tsig, navgs=5, dtype=np.float32)
+
+    assert psd32.values.dtype == np.float32
+    assert np.allclose(psd32, psd64, rtol=1e-3, atol=1e-6)
+
+
+def test_averaged_tf_float32():
+    np.random.seed(2023)
+    fs = 10
+    T = 5.0
+    t = np.linspace(0, T, int(T*fs), endpoint=False)
+    x = 0.5*np.sin(2*np.pi*2*t) + np.random.random(len(t))
+    y = np.roll(x, 3)
+    x_tsig = pd.Series(x, index=pd.TimedeltaIndex(t, 's'))
+    y_tsig = pd.Series(y, index=pd.TimedeltaIndex(t, 's'))
+
+    tf64, coh64 = averaged_tf(x_tsig, y_tsig, navgs=5)
+    tf32, coh32 = averaged_tf(x_tsig, y_tsig, navgs=5, dtype=np.float32)
+
+    assert tf32.values.dtype == np.complex64
+    assert np.allclose(tf32, tf64, rtol=1e-3, atol=1e-4)
+    assert np.allclose(coh32, coh64, rtol=1e-3, atol=1e-4)
+
+
+@pytest.mark.parametrize("detrend", [None, False, 'constant', 'linear'])
+def test_averaged_tf_detrend(detrend):
+    np.random.seed(2023)
+    fs = 10
+    T = 5.0
+    t = np.linspace(0, T, int(T*fs), endpoint=False)
+    x = 0.5*np.sin(2*np.pi*2*t) + np.random.random(len(t))
+    y = np.roll(x, 3)
+    x_tsig = pd.Series(x, index=pd.TimedeltaIndex(t, 's'))
+    y_tsig = pd.Series(y, index=pd.TimedeltaIndex(t, 's'))
+
+    navgs = 5
+    tf, coh = averaged_tf(x_tsig, y_tsig, navgs, 0.5, 'hamming', detrend)
+
+    # scipy spells "skip detrending" as False
+    sp_detrend = False if detrend is None else detrend
+    freqs, Pxy = signal.csd(x, y, fs, 'hamming', nperseg=len(x)//navgs,
+                            noverlap=len(x)//(2*navgs), detrend=sp_detrend)
+    freqs, Pxx = signal.welch(x, fs, 'hamming', nperseg=len(x)//navgs,
+                              noverlap=len(x)//(2*navgs), detrend=sp_detrend)
+
+    assert np.allclose(tf, pd.DataFrame(Pxy / Pxx), atol=1e-5)
+
+
+def test_interp_tf_derived_filter():
+    # Create a simple transfer function
+    freqs = np.linspace(0, 1, 100)
+    mag = np.abs(np.sin(2*np.pi*freqs)) + 0.1
+    phase = np.unwrap(np.sin(2*np.pi*freqs)+freqs*6)
+    tf = pd.Series(mag * np.exp(1j * phase), index=freqs)
+
+    new_freq = np.linspace(0, 1, 200)
+    base = interp_tf(new_freq, tf)
+
+    # A filter derived from an already-interpolated one must not reuse the
+    # original's cached magnitude/phase (attrs propagate through arithmetic)
+    doubled = interp_tf(new_freq, tf * 2)
+
+    assert np.allclose(doubled, 2 * base, atol=1e-5)